@@ -0,0 +1,33 @@
+# cython: language_level=3
+"""
+Compiled per-file check for Arnold_TX_convert.py / tx_convert_gui.py.
+
+Build next to the scripts with:  cythonize -i tx_classify.pyx
+When the extension is not built, the scripts use their pure-Python
+classify_entry, which this module must match. The tag tuples are not
+duplicated here: the importing script hands over its own COLOR_TAGS and
+DSP_TAGS through set_tags() before using classify_entry.
+"""
+
+cdef tuple COLOR_TAGS = ()
+cdef tuple DSP_TAGS   = ()
+
+
+def set_tags(tuple color_tags, tuple dsp_tags):
+    global COLOR_TAGS, DSP_TAGS
+    COLOR_TAGS = color_tags
+    DSP_TAGS = dsp_tags
+
+
+cpdef tuple classify_entry(str name, double src_mtime, double dst_mtime):
+    cdef str low, tag
+    if src_mtime <= dst_mtime:
+        return (False, False, False)
+    low = name.lower()
+    for tag in DSP_TAGS:
+        if tag in low:
+            return (False, True, True)
+    for tag in COLOR_TAGS:
+        if tag in low:
+            return (True, False, True)
+    return (False, False, True)
@@ -6,9 +6,10 @@ Arnold TX Converter - PySide6 GUI
 - Strictly Arnold-focused maketx wrapper
 - OCIO: choose .ocio file in GUI, else fallback to $OCIO
 - maketx.exe: choose once, path is remembered in ~/.arnold_tx_converter.json
-- Concurrency: uses up to (CPU cores - 1) concurrent maketx processes
+- Concurrency: keeps up to (2 x CPU cores) single-threaded maketx processes in flight
 - Output: .tx written next to source textures
-- Skips: skip if .tx exists and is newer than source
+- Skips: skip if .tx exists and is newer than source; conversions are remembered
+  in ~/.arnold_tx_converter_cache.db so reruns skip without re-statting the .tx
 - Logging: in-UI log + optional log file
 """
 
@@ -16,19 +17,41 @@ import os
 import sys
 import json
 import shutil
+import asyncio
 import argparse
+import hashlib
+import sqlite3
 import datetime
+import tempfile
 import subprocess
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 CONFIG_FILE = Path.home() / ".arnold_tx_converter.json"
+CACHE_FILE = Path.home() / ".arnold_tx_converter_cache.db"
 
 VALID_EXTS = (".png", ".jpg", ".jpeg", ".tif", ".tiff", ".exr", ".dds", ".tga", ".bmp", ".psd")
+VALID_EXT_SET = frozenset(VALID_EXTS)
 COLOR_TAGS = ("srgb", "basecolor", "albedo", "color", "diffuse")
 DSP_TAGS   = ("dsp", "disp", "displacement", "zdisp", "height")
+MAX_ERR_BYTES = 4096
+
+# On Windows the windowed build would otherwise flash a console for every
+# maketx launch. Elsewhere, close_fds=False lets subprocess use posix_spawn
+# instead of fork+exec from the large PySide6 process; descriptors Python
+# opens are non-inheritable by default, so nothing extra leaks into maketx.
+if os.name == "nt":
+    SPAWN_KWARGS = {"creationflags": subprocess.CREATE_NO_WINDOW}
+else:
+    SPAWN_KWARGS = {"close_fds": False}
 
 
 # ---------------------------
@@ -50,104 +73,304 @@ def save_config(cfg: dict):
         print("Failed to save config:", e)
 
 
+# ---------------------------
+# Conversion cache
+# ---------------------------
+
+def open_cache():
+    try:
+        db = sqlite3.connect(CACHE_FILE)
+        db.execute("CREATE TABLE IF NOT EXISTS converted ("
+                   "path TEXT PRIMARY KEY, mtime REAL, size INTEGER, cmd_hash TEXT, tx_mtime REAL)")
+        return db
+    except sqlite3.Error as e:
+        print("Failed to open conversion cache:", e)
+        return None
+
+def load_cache(db, root: Path, recursive: bool) -> dict:
+    """Map source path -> (mtime, size, cmd_hash, tx_mtime) for rows under root."""
+    # Range scan on the primary key: everything that starts with "<root><sep>",
+    # narrowed to direct children of root when the walk won't recurse.
+    lo = os.fspath(root).rstrip(os.sep) + os.sep
+    hi = lo[:-1] + chr(ord(os.sep) + 1)
+    query = ("SELECT path, mtime, size, cmd_hash, tx_mtime FROM converted "
+             "WHERE path >= ? AND path < ?")
+    args = (lo, hi)
+    if not recursive:
+        query += " AND instr(substr(path, ?), ?) = 0"
+        args += (len(lo) + 1, os.sep)
+    try:
+        return {row[0]: row[1:] for row in db.execute(query, args)}
+    except sqlite3.Error as e:
+        print("Failed to read conversion cache:", e)
+        return {}
+
+def save_cache(db, rows: list, stale: list = ()):
+    try:
+        with db:
+            db.executemany("INSERT OR REPLACE INTO converted VALUES (?, ?, ?, ?, ?)", rows)
+            db.executemany("DELETE FROM converted WHERE path = ?", ((p,) for p in stale))
+    except sqlite3.Error as e:
+        print("Failed to update conversion cache:", e)
+
+
 # ---------------------------
 # maketx helpers
 # ---------------------------
 
-def is_displacement(fname: Path) -> bool:
-    low = fname.name.lower()
-    return any(tag in low for tag in DSP_TAGS)
-
-def is_color(fname: Path) -> bool:
-    low = fname.name.lower()
-    if is_displacement(fname):
-        return False
-    return any(tag in low for tag in COLOR_TAGS)
-
-def needs_conversion(src: Path, dst: Path) -> bool:
-    if not dst.exists():
-        return True
-    return src.stat().st_mtime > dst.stat().st_mtime
-
-def build_maketx_cmd(src: Path, ocio_path: str | None, verbose: bool,
-                     is_col: bool, is_dsp: bool, maketx_path: str) -> list[str]:
-    cmd = [maketx_path, str(src)]
-
-    if ocio_path:
-        cmd += ["--colorconfig", ocio_path]
-
-    cmd += [
-        "--opaque-detect", "--constant-color-detect", "--monochrome-detect",
-        "--fixnan", "box3",
-        "-u",
-        "--filter", "lanczos3",
-        "--attrib", "tiff:half", "1",
-        "--unpremult",
-        "--oiio",
-    ]
-
-    cmd += ["--colorconvert"]
-    if is_col:
-        cmd += ["Utility - sRGB - Texture", "ACES - ACEScg"]
-    else:
-        cmd += ["Utility - Raw", "ACES - ACEScg"]
-
-    if is_dsp:
-        cmd += ["-d", "float"]
-    else:
-        cmd += ["-d", "half"]
-
-    if verbose:
-        cmd += ["-v"]
-
-    cmd += ["--threads", "1"]
-    return cmd
-
-def convert_one(src: Path, ocio_path: str | None, verbose: bool, maketx_path: str) -> tuple[Path, bool, str]:
+def _build_tag_automaton():
+    if ahocorasick is None:
+        return None
+    ac = ahocorasick.Automaton()
+    for tag in COLOR_TAGS:
+        ac.add_word(tag, False)
+    for tag in DSP_TAGS:
+        ac.add_word(tag, True)
+    ac.make_automaton()
+    return ac
+
+_TAG_AC = _build_tag_automaton()
+
+def classify(name: str) -> tuple[bool, bool]:
+    """Return (is_color, is_displacement) for a file name; displacement wins."""
+    low = name.lower()
+    if _TAG_AC is None:
+        if any(tag in low for tag in DSP_TAGS):
+            return (False, True)
+        return (any(tag in low for tag in COLOR_TAGS), False)
+    col = False
+    for _, dsp in _TAG_AC.iter(low):
+        if dsp:
+            return (False, True)
+        col = True
+    return (col, False)
+
+# Stands in for the .tx mtime when there is no .tx, so any source is newer.
+NO_TX = float("-inf")
+
+def needs_conversion(src_mtime: float, dst_mtime: float) -> bool:
+    return src_mtime > dst_mtime
+
+def classify_entry(name: str, src_mtime: float, dst_mtime: float) -> tuple[bool, bool, bool]:
+    """Return (is_color, is_dsp, needs); dst_mtime is NO_TX when there is no .tx."""
+    if not needs_conversion(src_mtime, dst_mtime):
+        return (False, False, False)
+    return (*classify(name), True)
+
+# Compiled drop-in for the per-file check (cythonize -i tx_classify.pyx).
+# It takes its tags from here so both paths classify identically.
+try:
+    import tx_classify
+except ImportError:
+    tx_classify = None
+else:
+    tx_classify.set_tags(COLOR_TAGS, DSP_TAGS)
+    classify_entry = tx_classify.classify_entry
+
+_CMD_STATIC = (
+    "--opaque-detect", "--constant-color-detect", "--monochrome-detect",
+    "--fixnan", "box3",
+    "-u",
+    "--filter", "lanczos3",
+    "--attrib", "tiff:half", "1",
+    "--unpremult",
+    "--oiio",
+)
+_CMD_COL = ("--colorconvert", "Utility - sRGB - Texture", "ACES - ACEScg")
+_CMD_RAW = ("--colorconvert", "Utility - Raw", "ACES - ACEScg")
+
+# POSIX exec takes bytes, so argv is encoded once up front instead of per
+# argument per launch; Windows builds a str command line, so it stays str.
+fsarg = os.fspath if os.name == "nt" else os.fsencode
+
+# Everything after the OCIO args, keyed by (is_col, is_dsp, verbose).
+_TAILS = {
+    (col, dsp, verbose): tuple(map(fsarg,
+        _CMD_STATIC
+        + (_CMD_COL if col else _CMD_RAW)
+        + (("-d", "float") if dsp else ("-d", "half"))
+        + (("-v",) if verbose else ())
+        + ("--threads", "1")
+    ))
+    for col in (False, True) for dsp in (False, True) for verbose in (False, True)
+}
+
+def ocio_args(ocio_path: str | None) -> tuple:
+    return (fsarg("--colorconfig"), fsarg(ocio_path)) if ocio_path else ()
+
+# maketx accepts exactly one input file per invocation (and has no
+# files-from option), so conversions cannot be batched into a shared
+# process; every texture gets its own launch.
+def build_maketx_cmd(src: Path, ocio: tuple, verbose: bool,
+                     is_col: bool, is_dsp: bool, maketx: str | bytes) -> list:
+    """ocio and maketx are pre-encoded with ocio_args()/fsarg() once per run."""
+    tail = _TAILS[(bool(is_col), bool(is_dsp), bool(verbose))]
+    return [maketx, fsarg(src), *ocio, *tail]
+
+def cmd_hash(maketx: str | bytes, ocio: tuple) -> str:
+    """Fingerprint of everything but the source path that shapes the output."""
+    h = hashlib.sha1()
+    for arg in (maketx, *ocio, *(a for k in sorted(_TAILS) if not k[2] for a in _TAILS[k])):
+        h.update(os.fsencode(arg) + b"\0")
+    return h.hexdigest()
+
+async def convert_one(src: Path, col: bool, dsp: bool, ocio: tuple,
+                      verbose: bool, maketx: str | bytes) -> tuple[Path, bool, str]:
     try:
-        dst = src.with_suffix(src.suffix + ".tx") if src.suffix.lower() != ".tx" else src
         if src.suffix.lower() == ".tx":
             return (src, False, "Already a .tx; skipping.")
 
-        if not needs_conversion(src, dst):
-            return (src, False, f"Up-to-date .tx exists: {dst.name}; skipping.")
-
-        col = is_color(src)
-        dsp = is_displacement(src)
-        cmd = build_maketx_cmd(src, ocio_path, verbose, col, dsp, maketx_path)
-
-        proc = subprocess.run(
-            cmd,
-            shell=False,
-            stdout=subprocess.PIPE if verbose else subprocess.DEVNULL,
-            stderr=subprocess.PIPE,
-            text=True,
-            check=False
-        )
-
-        if proc.returncode == 0:
-            out_msg = ""
-            if verbose and proc.stdout:
-                out_msg += proc.stdout.strip()
-            return (src, True, out_msg or "OK")
-        else:
-            err = (proc.stderr or "").strip()
-            return (src, False, f"maketx failed: {err if err else 'Unknown error'}")
+        cmd = build_maketx_cmd(src, ocio, verbose, col, dsp, maketx)
+
+        # stderr goes to a temp file rather than a pipe: nothing to drain on
+        # success, and a chatty maketx can never block on a full pipe buffer.
+        with tempfile.TemporaryFile() as errf:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE if verbose else asyncio.subprocess.DEVNULL,
+                stderr=errf,
+                **SPAWN_KWARGS,
+            )
+            if verbose:
+                stdout, _ = await proc.communicate()
+            else:
+                stdout = None
+                await proc.wait()
+
+            if proc.returncode == 0:
+                out_msg = ""
+                if verbose and stdout:
+                    out_msg += stdout.decode(errors="replace").strip()
+                return (src, True, out_msg or "OK")
+            else:
+                # maketx reports the actual error last, after any warnings.
+                size = errf.seek(0, os.SEEK_END)
+                errf.seek(max(0, size - MAX_ERR_BYTES))
+                tail = errf.read()
+                if size > MAX_ERR_BYTES:
+                    tail = tail.partition(b"\n")[2]  # drop the cut-off first line
+                err = tail.decode(errors="replace").strip()
+                return (src, False, f"maketx failed: {err if err else 'Unknown error'}")
 
     except Exception as e:
         return (src, False, f"Exception: {e}")
 
 
+# ---------------------------
+# File discovery
+# ---------------------------
+
+SCAN_WORKERS = 8
+
+
+def _scan_dir(path: str, exts: frozenset[str], filt: str, cache: dict,
+              chash: str, scanned: set) -> tuple[list, list]:
+    candidates, tx_entries, subdirs = [], {}, []
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+                continue
+            # Cheap name checks first; is_file() and Path() only for candidates.
+            name = entry.name
+            dot = name.rfind(".")
+            if dot <= 0:
+                continue
+            ext = name[dot:].lower()
+            if ext == ".tx":
+                tx_entries[os.path.normcase(name)] = entry
+                continue
+            if ext not in exts:
+                continue
+            if filt and filt not in name:
+                continue
+            if not entry.is_file():
+                continue
+            candidates.append(entry)
+    scanned.add(path)
+
+    # The sibling .tx entries come from the same listing, so the freshness
+    # check costs no extra lookups and up-to-date files are never classified.
+    # A cache row written by an earlier run with the same settings also
+    # spares the stat of the .tx itself.
+    files = []
+    for entry in candidates:
+        try:
+            st = entry.stat()
+        except OSError:
+            continue  # source vanished since the listing
+        mtime, size = st.st_mtime, st.st_size
+        tx = tx_entries.get(os.path.normcase(entry.name + ".tx"))
+        # Popped so that, once the walk ends, only rows for unseen paths remain.
+        row = cache.pop(entry.path, None)
+        if not tx:
+            row = None
+        if row and row[0] == mtime and row[1] == size and row[2] == chash and row[3] >= mtime:
+            files.append((Path(entry.path), mtime, size, None))
+            continue
+        # A dangling or just-deleted .tx counts as no .tx, as dst.exists() did.
+        try:
+            tx_mtime = tx.stat().st_mtime if tx else NO_TX
+        except OSError:
+            tx_mtime = NO_TX
+        col, dsp, needs = classify_entry(entry.name, mtime, tx_mtime)
+        files.append((Path(entry.path), mtime, size, (col, dsp) if needs else None))
+    return files, subdirs
+
+def walk(root: Path, recursive: bool, exts: frozenset[str], filt: str,
+         cache: dict | None = None, chash: str = "", onerror=None,
+         scanned: set | None = None):
+    """Yield one list of (path, st_mtime, st_size, flags) per scanned directory.
+
+    flags is (is_color, is_dsp), or None when an up-to-date .tx already
+    sits next to the source.
+
+    Recursive walks scan several directories at a time so their metadata
+    reads overlap instead of queueing behind each other. A subdirectory
+    that cannot be read is skipped and its OSError passed to onerror, like
+    os.walk; only a failure on the root itself is raised. Every directory
+    listed in full is added to scanned.
+    """
+    if cache is None:
+        cache = {}
+    if scanned is None:
+        scanned = set()
+    if not recursive:
+        yield _scan_dir(os.fspath(root), exts, filt, cache, chash, scanned)[0]
+        return
+
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as ex:
+        root_fut = ex.submit(_scan_dir, os.fspath(root), exts, filt, cache, chash, scanned)
+        pending = {root_fut}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                try:
+                    files, subdirs = fut.result()
+                except OSError as e:
+                    if fut is root_fut:
+                        raise
+                    if onerror is not None:
+                        onerror(e)
+                    continue
+                for d in subdirs:
+                    pending.add(ex.submit(_scan_dir, d, exts, filt, cache, chash, scanned))
+                if files:
+                    yield files
+
+
 # ---------------------------
 # Worker
 # ---------------------------
 
 class ConvertWorker(QtCore.QObject):
-    progress = QtCore.Signal(int, int)
-    item_done = QtCore.Signal(str)
+    progress = QtCore.Signal(int)
     finished = QtCore.Signal(int, int)
     fatal = QtCore.Signal(str)
 
+    _loop: asyncio.AbstractEventLoop | None = None
+    _loop_lock = threading.Lock()
+
     def __init__(self, root_dir: Path, filter_str: str, recursive: bool,
                  ocio_file: str | None, verbose: bool, maketx_path: str, parent=None):
         super().__init__(parent)
@@ -158,11 +381,48 @@ class ConvertWorker(QtCore.QObject):
         self.verbose = verbose
         self.maketx_path = maketx_path.strip()
         self._cancelled = False
+        # Per-file messages are polled by the GUI timer instead of crossing
+        # threads as one signal each; progress only signals when the percent
+        # actually changes.
+        self._log_buf: list[str] = []
+        self._log_lock = threading.Lock()
+        self.done = 0
+        self.total = 0
+        self.scanning = True
+        self._last_pct = -1
 
     def cancel(self):
         self._cancelled = True
 
+    def _log(self, msg: str):
+        with self._log_lock:
+            self._log_buf.append(msg)
+
+    def take_log(self) -> list[str]:
+        with self._log_lock:
+            batch, self._log_buf = self._log_buf, []
+        return batch
+
+    def _on_walk_error(self, err: OSError):
+        self._log(f"• Skipping unreadable folder: {err}")
+
+    def _update_progress(self):
+        pct = self.done * 100 // self.total if self.total else 0
+        if pct != self._last_pct:
+            self._last_pct = pct
+            self.progress.emit(pct)
+
     def run(self):
+        # One event loop reaps every maketx child as it exits. It is kept
+        # across runs so back-to-back jobs don't repay loop setup; the lock
+        # covers a new job starting while the last one is still unwinding.
+        with ConvertWorker._loop_lock:
+            loop = ConvertWorker._loop
+            if loop is None or loop.is_closed():
+                loop = ConvertWorker._loop = asyncio.new_event_loop()
+            loop.run_until_complete(self.run_async())
+
+    async def run_async(self):
         if not self.maketx_path or not Path(self.maketx_path).exists():
             self.fatal.emit("maketx.exe not set or not found. Please select the path in the GUI.")
             return
@@ -183,59 +443,142 @@ class ConvertWorker(QtCore.QObject):
                 return
             ocio_to_use = env_ocio
 
-        files = []
-        try:
-            if self.recursive:
-                for p in self.root_dir.rglob("*"):
-                    if p.is_file() and p.suffix.lower() in VALID_EXTS:
-                        if self.filter_str and self.filter_str not in p.name:
-                            continue
-                        files.append(p)
-            else:
-                for p in self.root_dir.glob("*"):
-                    if p.is_file() and p.suffix.lower() in VALID_EXTS:
-                        if self.filter_str and self.filter_str not in p.name:
-                            continue
-                        files.append(p)
-        except Exception as e:
-            self.fatal.emit(f"Failed to list files: {e}")
-            return
-
-        total = len(files)
-        if total == 0:
-            self.fatal.emit("No valid textures in folder (check extensions or filter).")
-            return
-
-        cpu = max(1, (os.cpu_count() or 1) - 1)
-        max_workers = max(1, cpu)
-
-        self.item_done.emit(f"Found {total} texture(s). Using {max_workers} worker(s).")
-        done = 0
+        # Each maketx runs single-threaded; oversubscribe so cores stay busy
+        # while some processes are stalled on texture I/O.
+        max_workers = 2 * (os.cpu_count() or 1)
+        self._log(f"Scanning for textures. Using {max_workers} worker(s).")
+
+        ocio = ocio_args(ocio_to_use)
+        maketx = fsarg(self.maketx_path)
+        chash = cmd_hash(maketx, ocio)
+        # Absolute so cache keys don't depend on how the folder was typed.
+        root = self.root_dir.absolute()
+        db = open_cache()
+        cache = load_cache(db, root, self.recursive) if db else {}
+        cache_rows = []
+        stale = []
+        scanned = set()
+
+        loop = asyncio.get_running_loop()
+        # Bounded so the walk pauses when launches fall far behind it.
+        discovered = asyncio.Queue(maxsize=512)
+        # Finished tasks push themselves here; as_completed would wrap and
+        # re-scan every pending task on each completion.
+        completed = asyncio.Queue()
+        sem = asyncio.Semaphore(max_workers)
+        running = set()
         ok = 0
         fail = 0
 
-        with ThreadPoolExecutor(max_workers=max_workers) as ex:
-            futures = {ex.submit(convert_one, p, ocio_to_use, self.verbose, self.maketx_path): p for p in files}
-            for fut in as_completed(futures):
+        def produce():
+            # Runs on a helper thread and hands over each directory's matches
+            # as soon as it is scanned, so maketx starts before the walk ends.
+            try:
+                for batch in walk(root, self.recursive, VALID_EXT_SET, self.filter_str,
+                                  cache, chash, onerror=self._on_walk_error, scanned=scanned):
+                    if self._cancelled:
+                        break
+                    asyncio.run_coroutine_threadsafe(discovered.put(batch), loop).result()
+                else:
+                    # Rows the walk never matched, in a directory it listed in
+                    # full and without a name filter, belong to sources that
+                    # are gone; no extra stat is needed to tell.
+                    if not self.filter_str:
+                        stale.extend(p for p in cache if os.path.dirname(p) in scanned)
+            finally:
+                asyncio.run_coroutine_threadsafe(discovered.put(None), loop).result()
+
+        async def launch(p: Path, mtime: float, size: int, col: bool, dsp: bool):
+            try:
+                result = await convert_one(p, col, dsp, ocio, self.verbose, maketx)
+                if result[1]:
+                    try:
+                        tx_mtime = os.stat(os.fspath(p) + ".tx").st_mtime
+                        cache_rows.append((os.fspath(p), mtime, size, chash, tx_mtime))
+                    except OSError:
+                        pass
+                return result
+            finally:
+                sem.release()
+
+        async def reap():
+            nonlocal ok, fail
+            while (fut := await completed.get()) is not None:
                 if self._cancelled:
-                    self.item_done.emit("Cancellation requested. Stopping...")
-                    break
+                    self._log("Cancellation requested. Stopping...")
+                    return
                 src, success, message = fut.result()
-                done += 1
+                self.done += 1
+                self._update_progress()
                 if success:
                     ok += 1
-                    self.item_done.emit(f"✓ {src.name}: {message}")
+                    self._log(f"✓ {src.name}: {message}")
                 else:
                     if "skip" in message.lower():
-                        self.item_done.emit(f"• {src.name}: {message}")
+                        self._log(f"• {src.name}: {message}")
                     else:
                         fail += 1
-                        self.item_done.emit(f"✗ {src.name}: {message}")
-                self.progress.emit(done, total)
+                        self._log(f"✗ {src.name}: {message}")
+
+        listing = loop.run_in_executor(None, produce)
+        reaper = asyncio.ensure_future(reap())
+        while (batch := await discovered.get()) is not None:
+            self.total += len(batch)
+            self._update_progress()
+            for p, mtime, size, flags in batch:
+                if flags is None:
+                    self.done += 1
+                    self._update_progress()
+                    self._log(f"• {p.name}: Up-to-date .tx exists: {p.name}.tx; skipping.")
+                    continue
+                await sem.acquire()
+                if self._cancelled:
+                    sem.release()
+                    continue
+                task = asyncio.ensure_future(launch(p, mtime, size, *flags))
+                task.add_done_callback(completed.put_nowait)
+                task.add_done_callback(running.discard)
+                running.add(task)
+        self.scanning = False
+
+        listing_error = None
+        try:
+            await listing
+        except Exception as e:
+            listing_error = e
+
+        # Let in-flight maketx processes exit before reporting.
+        await asyncio.gather(*running)
+        completed.put_nowait(None)
+        await reaper
 
+        if db:
+            if cache_rows or stale:
+                save_cache(db, cache_rows, stale)
+            db.close()
+
+        if listing_error is not None:
+            self.fatal.emit(f"Failed to list files: {listing_error}")
+            return
+        if self.total == 0:
+            self.fatal.emit("No valid textures in folder (check extensions or filter).")
+            return
+        self._log(f"Found {self.total} texture(s).")
         self.finished.emit(ok, fail)
 
 
+class ConvertRunnable(QtCore.QRunnable):
+    """Runs a ConvertWorker job on the global QThreadPool."""
+
+    def __init__(self, worker: ConvertWorker):
+        super().__init__()
+        self.worker = worker
+        self.setAutoDelete(True)
+
+    def run(self):
+        self.worker.run()
+
+
 # ---------------------------
 # Main GUI
 # ---------------------------
@@ -243,8 +586,8 @@ class ConvertWorker(QtCore.QObject):
 class TxConverterUI(QtWidgets.QWidget):
     def __init__(self):
         super().__init__()
-        self.worker_thread = None
         self.worker = None
+        self._cfg = load_config()
         self._init_ui()
         self._apply_style()
         self._load_saved_config()
@@ -275,6 +618,9 @@ class TxConverterUI(QtWidgets.QWidget):
 
         self.log = QtWidgets.QPlainTextEdit()
         self.log.setReadOnly(True)
+        self.log.setMaximumBlockCount(5000)
+        self.log.setUndoRedoEnabled(False)
+        self._log_cursor = self.log.textCursor()
         self.save_log_btn = QtWidgets.QPushButton("Save Log…")
 
         form = QtWidgets.QFormLayout()
@@ -310,6 +656,10 @@ class TxConverterUI(QtWidgets.QWidget):
 
         self.recursive_chk.setChecked(True)
 
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setInterval(100)
+        self._flush_timer.timeout.connect(self._flush_worker)
+
     def _apply_style(self):
         self.setStyleSheet("""
         QLineEdit, QPlainTextEdit {
@@ -332,11 +682,25 @@ class TxConverterUI(QtWidgets.QWidget):
         """)
 
     def _load_saved_config(self):
-        cfg = load_config()
-        if "maketx" in cfg:
-            self.maketx_edit.setText(cfg["maketx"])
-
-    def append_log(self, text): self.log.appendPlainText(text)
+        if "maketx" in self._cfg:
+            self.maketx_edit.setText(self._cfg["maketx"])
+
+    def _set_cfg(self, key, val):
+        if self._cfg.get(key) == val: return
+        self._cfg[key] = val
+        save_config(self._cfg)
+
+    def append_log(self, text):
+        # Insert through a cached cursor with repaints suspended instead of
+        # appendPlainText, which redoes layout and cursor work on every call.
+        sb = self.log.verticalScrollBar()
+        at_bottom = sb.value() == sb.maximum()
+        self.log.setUpdatesEnabled(False)
+        self._log_cursor.movePosition(QtGui.QTextCursor.MoveOperation.End)
+        if not self.log.document().isEmpty(): text = "\n" + text
+        self._log_cursor.insertText(text)
+        self.log.setUpdatesEnabled(True)
+        if at_bottom: sb.setValue(sb.maximum())
 
     def set_busy(self, busy: bool):
         self.start_btn.setEnabled(not busy)
@@ -354,7 +718,7 @@ class TxConverterUI(QtWidgets.QWidget):
         f, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Choose maketx.exe", str(Path.home()), "maketx (maketx.exe)")
         if f:
             self.maketx_edit.setText(f)
-            cfg = load_config(); cfg["maketx"] = f; save_config(cfg)
+            self._set_cfg("maketx", f)
 
     def on_start(self):
         folder = self.path_edit.text().strip()
@@ -369,36 +733,43 @@ class TxConverterUI(QtWidgets.QWidget):
         if not maketx_path:
             QtWidgets.QMessageBox.warning(self,"Missing maketx","Select maketx.exe")
             return
-        cfg = load_config(); cfg["maketx"] = maketx_path; save_config(cfg)
+        self._set_cfg("maketx", maketx_path)
 
         self.progress.setValue(0)
+        self.progress.setFormat("%p%")
         self.append_log(f"=== Starting on {root_dir} ===")
 
-        self.worker_thread = QtCore.QThread(self)
+        # The worker stays owned by the GUI thread, so its signals are queued
+        # back here from the pool thread that runs the job.
         self.worker = ConvertWorker(root_dir, filter_str, recursive, ocio_file, verbose, maketx_path)
-        self.worker.moveToThread(self.worker_thread)
-        self.worker_thread.started.connect(self.worker.run)
-        self.worker.item_done.connect(self.append_log)
         self.worker.progress.connect(self.on_progress)
+        self.worker.finished.connect(self._flush_worker)
+        self.worker.fatal.connect(self._flush_worker)
         self.worker.finished.connect(self.on_finished)
         self.worker.fatal.connect(self.on_fatal)
-        self.worker.finished.connect(self._stop_worker_thread)
-        self.worker.fatal.connect(self._stop_worker_thread)
+        self.worker.finished.connect(self._stop_worker)
+        self.worker.fatal.connect(self._stop_worker)
         self.set_busy(True)
-        self.worker_thread.start()
+        self._flush_timer.start()
+        QtCore.QThreadPool.globalInstance().start(ConvertRunnable(self.worker))
+
+    def _flush_worker(self, *args):
+        if not self.worker: return
+        batch = self.worker.take_log()
+        if batch: self.append_log("\n".join(batch))
+        self.progress.setFormat("%p% (scanning…)" if self.worker.scanning else "%p%")
 
-    def _stop_worker_thread(self,*args):
+    def _stop_worker(self,*args):
+        self._flush_timer.stop()
         if self.worker: self.worker.cancel()
-        if self.worker_thread:
-            self.worker_thread.quit(); self.worker_thread.wait()
-        self.worker=None; self.worker_thread=None
+        self.worker=None
         self.set_busy(False)
 
     def on_cancel(self):
         if self.worker: self.worker.cancel()
         self.append_log("Cancellation requested…")
 
-    def on_progress(self, done,total): self.progress.setValue(int(done/max(1,total)*100))
+    def on_progress(self, pct): self.progress.setValue(pct)
 
     def on_finished(self, ok, fail): self.append_log(f"Done. Success:{ok} Fail:{fail}")
 